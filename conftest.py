@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from utils.benchmark import benchmark_recorder, load_baseline
+from utils.locator_profiler import locator_profiler
+
+DEFAULT_BENCHMARK_BASELINE = Path(__file__).parent / "tests" / "benchmarks" / "baseline.json"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--profile-locators",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Profile the resolution of every component locator and write the JSON report to PATH.",
+    )
+    parser.addoption(
+        "--perf-json",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Write the benchmark results to PATH as JSON.",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default=str(DEFAULT_BENCHMARK_BASELINE),
+        metavar="PATH",
+        help="Baseline the benchmark results are compared against.",
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        default=False,
+        help="Store the benchmark results as the new baseline instead of comparing against it.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    locator_profiler.enabled = bool(config.getoption("--profile-locators"))
+    config.benchmark_comparisons = []
+    config.benchmark_notes = []
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:  # xdist worker: hand the results over to the controller
+        workeroutput["locator_profile"] = locator_profiler.report()["locators"]
+        workeroutput["benchmarks"] = benchmark_recorder.report()
+        return
+
+    report_path = config.getoption("--profile-locators")
+    if report_path:
+        locator_profiler.write_report(report_path)
+
+    if benchmark_recorder.results:
+        _finish_benchmarks(session)
+
+
+def _finish_benchmarks(session: pytest.Session) -> None:
+    config = session.config
+    results_path = config.getoption("--perf-json")
+    baseline_path = config.getoption("--perf-baseline")
+    if results_path:
+        benchmark_recorder.write_report(results_path)
+
+    if config.getoption("--perf-update-baseline"):
+        if session.exitstatus != pytest.ExitCode.OK:
+            config.benchmark_notes.append(f"Some tests failed, baseline {baseline_path} not updated.")
+            return
+        benchmark_recorder.update_baseline(baseline_path)
+        config.benchmark_notes.append(
+            f"Updated {len(benchmark_recorder.results)} benchmarks in baseline {baseline_path}."
+        )
+        return
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        config.benchmark_notes.append(
+            f"No baseline at {baseline_path}, comparison skipped. Record one with --perf-update-baseline."
+        )
+        return
+
+    config.benchmark_comparisons = benchmark_recorder.compare(baseline)
+    missing = sorted(set(benchmark_recorder.results) - set(baseline))
+    if missing:
+        config.benchmark_notes.append(f"Not in baseline, comparison skipped: {', '.join(missing)}")
+    if any(comparison.is_regression for comparison in config.benchmark_comparisons):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    workeroutput = getattr(node, "workeroutput", {})
+    locator_profiler.merge(workeroutput.get("locator_profile", []))
+    benchmark_recorder.merge(workeroutput.get("benchmarks", {}))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    if hasattr(config, "workeroutput"):
+        return
+
+    report_path = config.getoption("--profile-locators")
+    if report_path:
+        terminalreporter.section("locator profile")
+        for stats in locator_profiler.ranked()[:10]:
+            flags = f" [{', '.join(sorted(stats.flags))}]" if stats.flags else ""
+            terminalreporter.write_line(
+                f"{stats.total_ms:10.1f} ms {stats.calls:6d}x  {stats.strategy:<11} {stats.query}{flags}"
+            )
+        terminalreporter.write_line(f"Full report: {report_path}")
+
+    if config.benchmark_comparisons or config.benchmark_notes:
+        terminalreporter.section("benchmark comparison")
+        for note in config.benchmark_notes:
+            terminalreporter.write_line(note)
+        for comparison in config.benchmark_comparisons:
+            status = "REGRESSION" if comparison.is_regression else "improved" if comparison.is_improvement else "ok"
+            terminalreporter.write_line(
+                f"{status:<10} {comparison.name:<45} {comparison.baseline_ms:9.2f} ms -> "
+                f"{comparison.current_ms:9.2f} ms ({comparison.change:+.0%}, "
+                f"threshold {comparison.threshold_ms:.2f} ms)"
+            )
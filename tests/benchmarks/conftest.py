@@ -0,0 +1,23 @@
+import pytest
+from playwright.sync_api import Page
+
+from tests.benchmarks.pages import build_component_page
+from utils.benchmark import BenchmarkRecorder, benchmark_recorder
+
+DOM_SIZES = [100, 1_000, 10_000]
+
+
+@pytest.fixture
+def perf() -> BenchmarkRecorder:
+    return benchmark_recorder
+
+
+@pytest.fixture(params=DOM_SIZES, ids=lambda dom_size: f"{dom_size}-rows")
+def dom_size(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture
+def component_page(page: Page, dom_size: int) -> Page:
+    page.set_content(build_component_page(dom_size))
+    return page
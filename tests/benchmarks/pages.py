@@ -0,0 +1,84 @@
+"""
+Generated local pages for the component benchmarks.
+
+Every page holds one instance of each basic component, surrounded by ``dom_size`` filler
+rows so that the cost of locating elements can be measured on DOMs of different sizes.
+"""
+
+# 1x1 transparent GIF, so that the page never touches the network.
+PIXEL = "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+
+SUGGESTIONS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo"]
+
+_SCRIPT = """
+const search = document.getElementById("search");
+const suggestions = document.getElementById("suggestions");
+search.addEventListener("input", () => {
+    const query = search.value.toLowerCase();
+    suggestions.replaceChildren(...SUGGESTIONS
+        .filter(suggestion => query && suggestion.toLowerCase().startsWith(query[0]))
+        .map(suggestion => {
+            const item = document.createElement("li");
+            item.textContent = `Suggestion ${suggestion}`;
+            item.addEventListener("click", () => {
+                search.value = suggestion;
+                suggestions.replaceChildren();
+            });
+            return item;
+        }));
+    suggestions.hidden = !suggestions.children.length;
+});
+
+window.showToast = lifetime => {
+    const toast = document.createElement("div");
+    toast.id = "toast";
+    toast.dataset.testid = "toast-success";
+    toast.textContent = "Saved successfully";
+    document.body.append(toast);
+    if (lifetime !== undefined) setTimeout(() => toast.remove(), lifetime);
+};
+"""
+
+
+def _filler(dom_size: int) -> str:
+    rows = []
+    for index in range(dom_size):
+        rows.append(
+            f'<div class="row" data-row="{index}"><span class="cell">Row {index}</span>'
+            f'<a class="cell" href="#row-{index}">Open {index}</a></div>'
+        )
+    return "\n".join(rows)
+
+
+def build_component_page(dom_size: int) -> str:
+    """
+    Builds a page with every basic component and ``dom_size`` filler rows.
+
+    :param dom_size: The number of filler rows, half of them placed before the components.
+    :return: The HTML of the page.
+    """
+    options = "\n".join(f'<option value="value-{index}">Option {index}</option>' for index in range(50))
+    before, after = _filler(dom_size // 2), _filler(dom_size - dom_size // 2)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Components ({dom_size} rows)</title></head>
+<body>
+<section id="filler-before">{before}</section>
+<form id="components" onsubmit="return false">
+    <label id="name-label" for="name">Full name</label>
+    <input id="name" name="name" type="text">
+    <select id="country" name="country">{options}</select>
+    <input id="newsletter" name="newsletter" type="checkbox">
+    <input id="dark-mode" name="dark-mode" type="checkbox" role="switch">
+    <input id="plan-free" name="plan" type="radio" value="free">
+    <input id="plan-pro" name="plan" type="radio" value="pro">
+    <input id="search" name="search" type="text" autocomplete="off">
+    <ul id="suggestions" hidden></ul>
+    <a id="docs-link" href="https://example.com/docs">Documentation</a>
+    <img id="logo" src="{PIXEL}" alt="Company logo">
+</form>
+<section id="filler-after">{after}</section>
+<script>const SUGGESTIONS = {SUGGESTIONS!r};{_SCRIPT}</script>
+</body>
+</html>
+"""
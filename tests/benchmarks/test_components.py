@@ -0,0 +1,126 @@
+import pytest
+from playwright.sync_api import Page
+
+from utils.benchmark import BenchmarkRecorder
+from web_abstractions.components.basic_components import (
+    AutocompleteComponent,
+    CheckboxComponent,
+    DropdownComponent,
+    ImageComponent,
+    InputComponent,
+    LabelComponent,
+    LinkComponent,
+    RadioButtonComponent,
+    ToastComponent,
+    ToggleComponent,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# Lifetime in milliseconds of the toast, so that wait_for_dismiss actually waits for it to disappear.
+TOAST_LIFETIME = 100
+
+
+def test_input_fill(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    name = InputComponent(component_page, "#name")
+
+    perf.measure(f"input.fill[{dom_size}]", lambda: name.fill("Jane Doe"))
+    perf.measure(f"input.get_value[{dom_size}]", name.get_value)
+
+    assert name.get_value() == "Jane Doe"
+
+
+def test_dropdown_selection(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    country = DropdownComponent(component_page, "#country")
+
+    perf.measure(f"dropdown.select_option_by_value[{dom_size}]", lambda: country.select_option_by_value("value-42"))
+    perf.measure(f"dropdown.select_option_by_index[{dom_size}]", lambda: country.select_option_by_index(7))
+    perf.measure(f"dropdown.select_option_by_text[{dom_size}]", lambda: country.select_option_by_text("Option 13"))
+
+    assert country.get_selected_option_text() == "Option 13"
+
+
+def test_checkbox_state_changes(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    newsletter = CheckboxComponent(component_page, "#newsletter")
+
+    def toggle() -> None:
+        newsletter.check()
+        newsletter.uncheck()
+
+    perf.measure(f"checkbox.check_uncheck[{dom_size}]", toggle)
+
+    assert not newsletter.locator.is_checked()
+
+
+def test_toggle_state_changes(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    dark_mode = ToggleComponent(component_page, "#dark-mode")
+
+    def switch() -> None:
+        dark_mode.turn_on()
+        dark_mode.turn_off()
+
+    perf.measure(f"toggle.turn_on_off[{dom_size}]", switch)
+
+    assert not dark_mode.is_checked()
+
+
+def test_radio_state_changes(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    free_plan = RadioButtonComponent(component_page, "#plan-free")
+    pro_plan = RadioButtonComponent(component_page, "#plan-pro")
+
+    def select() -> None:
+        free_plan.select()
+        pro_plan.select()
+
+    perf.measure(f"radio.select[{dom_size}]", select)
+
+    assert pro_plan.is_selected() and not free_plan.is_selected()
+
+
+def test_autocomplete(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    search = AutocompleteComponent(component_page, "#search", suggestion_selector="#suggestions")
+
+    def pick_suggestion() -> None:
+        search.clear_input()
+        search.locator.fill("B")
+        search.wait_for_suggestions()
+        search.select_suggestion("Suggestion Bravo")
+
+    perf.measure(f"autocomplete.set_value[{dom_size}]", lambda: search.set_value("Charlie"))
+    perf.measure(f"autocomplete.select_suggestion[{dom_size}]", pick_suggestion)
+
+    assert search.locator.input_value() == "Bravo"
+
+
+def test_toast_waits(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    toast = ToastComponent(component_page, "#toast")
+
+    def show_and_wait_for_dismiss() -> None:
+        component_page.evaluate(f"showToast({TOAST_LIFETIME})")
+        toast.locator.wait_for(state="visible")
+        toast.wait_for_dismiss()
+
+    perf.measure(f"toast.wait_for_dismiss[{dom_size}]", show_and_wait_for_dismiss)
+    component_page.evaluate("showToast()")
+    perf.measure(
+        f"toast.is_visible_with_message[{dom_size}]",
+        lambda: toast.is_visible_with_message("Saved successfully"),
+    )
+
+    assert toast.is_visible_with_message("Saved successfully")
+
+
+def test_link_label_image_reads(component_page: Page, dom_size: int, perf: BenchmarkRecorder):
+    link = LinkComponent(component_page, "#docs-link")
+    label = LabelComponent(component_page, "#name-label")
+    logo = ImageComponent(component_page, "#logo")
+
+    perf.measure(f"link.get_href[{dom_size}]", link.get_href)
+    perf.measure(f"link.get_text[{dom_size}]", link.get_text)
+    perf.measure(f"label.get_text[{dom_size}]", label.get_text)
+    perf.measure(f"image.get_src[{dom_size}]", logo.get_src)
+    perf.measure(f"image.get_alt_text[{dom_size}]", logo.get_alt_text)
+
+    assert link.get_href() == "https://example.com/docs"
+    assert label.get_text() == "Full name"
+    assert logo.get_alt_text() == "Company logo"
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.benchmark import BenchmarkRecorder
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PACKAGE = "web_abstractions.components.basic_components"
+ROUNDS = 10
+
+# Cold-start cost paid once by every pytest-xdist worker: the registry alone, then the first component used.
+COLD_IMPORTS = {
+    "import.registry": f"import {PACKAGE}",
+    "import.input_component": f"from {PACKAGE} import InputComponent",
+}
+
+
+def _cold_import_ms(statement: str) -> float:
+    """
+    Times the import statement in a fresh interpreter, excluding the interpreter start-up.
+
+    :param statement: The import statement to time.
+    :return: The import time in milliseconds.
+    """
+    code = f"import time\nstart = time.perf_counter()\n{statement}\nprint((time.perf_counter() - start) * 1000)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name, statement", COLD_IMPORTS.items(), ids=list(COLD_IMPORTS))
+def test_cold_import(name: str, statement: str, perf: BenchmarkRecorder):
+    perf.record(name, [_cold_import_ms(statement) for _ in range(ROUNDS)])
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page
+
+from utils.benchmark import BenchmarkRecorder
+from web_abstractions.components.basic_components.list import ListComponent
+
+VIRTUAL_LIST_PAGE = Path(__file__).parent.parent / "data" / "virtual_list.html"
+
+# Number of keys harvested from the top of the 100k-row list per benchmark round.
+HARVESTED_KEYS = 5000
+
+
+@pytest.fixture
+def virtual_list(page: Page) -> ListComponent:
+    page.goto(f"{VIRTUAL_LIST_PAGE.as_uri()}?rows=100000")
+    return ListComponent(page, "#list", ".row", key_attribute="data-key")
+
+
+@pytest.mark.benchmark
+def test_harvest_first_keys_of_100k_row_virtual_list(virtual_list: ListComponent, perf: BenchmarkRecorder):
+    keys = []
+
+    def harvest() -> None:
+        virtual_list.locator.evaluate(
+            "list => new Promise(resolve => { list.scrollTop = 0; requestAnimationFrame(resolve); })"
+        )
+        keys[:] = virtual_list.collect(limit=HARVESTED_KEYS, keys_only=True)
+
+    perf.measure(f"list.harvest_first_{HARVESTED_KEYS}_keys[100000]", harvest, rounds=3, warmup=0)
+
+    assert keys == [f"item-{index}" for index in range(HARVESTED_KEYS)]
+
+
+@pytest.mark.benchmark
+def test_harvest_stops_when_predicate_matches(virtual_list: ListComponent):
+    items = virtual_list.collect(until=lambda item: item["text"] == "Product 1500")
+
+    assert len(items) == 1501
+    assert items[-1] == {"key": "item-1500", "text": "Product 1500"}
+
+
+@pytest.mark.benchmark
+def test_harvest_reaches_end_of_list(page: Page):
+    page.goto(f"{VIRTUAL_LIST_PAGE.as_uri()}?rows=2000")
+    virtual_list = ListComponent(page, "#list", ".row", key_attribute="data-key", settle_time=50)
+
+    assert len(virtual_list.collect(keys_only=True)) == 2000
+
+
+@pytest.mark.benchmark
+def test_harvest_scrolls_the_document_when_the_list_does_not_scroll(page: Page):
+    # Fixed height but overflow: visible, so the rows overflow into the document, which scrolls instead
+    # and appends the next 20 rows whenever it comes close to the bottom.
+    page.set_content(
+        """
+        <div id="list" style="height: 200px"></div>
+        <script>
+            const list = document.getElementById("list");
+            const append = () => {
+                for (let index = list.children.length, end = index + 20; index < Math.min(end, 300); index++) {
+                    const row = document.createElement("div");
+                    row.className = "row";
+                    row.dataset.key = `item-${index}`;
+                    row.style.height = "50px";
+                    list.append(row);
+                }
+            };
+            append();
+            addEventListener("scroll", () => {
+                if (scrollY + innerHeight > document.documentElement.scrollHeight - 100) append();
+            });
+        </script>
+        """
+    )
+    virtual_list = ListComponent(page, "#list", ".row", key_attribute="data-key", settle_time=50)
+
+    assert virtual_list.collect(keys_only=True) == [f"item-{index}" for index in range(300)]
+
+
+@pytest.mark.benchmark
+def test_harvest_keys_items_with_the_same_text_apart(page: Page):
+    page.set_content(
+        """
+        <ul id="list">
+            <li class="row" data-key="sku-1">Acme Widget</li>
+            <li class="row" data-key="sku-2">Acme Widget</li>
+            <li class="row" data-key="sku-3">Other Widget</li>
+        </ul>
+        """
+    )
+
+    by_key = ListComponent(page, "#list", ".row", key_attribute="data-key", settle_time=50)
+    by_text = ListComponent(page, "#list", ".row", key_attribute=None, settle_time=50)
+
+    assert by_key.collect(keys_only=True) == ["sku-1", "sku-2", "sku-3"]
+    # Without a key attribute, items with the same text are only harvested once.
+    assert by_text.collect(keys_only=True) == ["Acme Widget", "Other Widget"]
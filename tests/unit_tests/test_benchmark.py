@@ -0,0 +1,112 @@
+import pytest
+
+from utils.benchmark import BenchmarkRecorder, BenchmarkResult, load_baseline
+
+
+def _baseline(median_ms: float, mad_ms: float = 0.0) -> dict:
+    return {"median_ms": median_ms, "mad_ms": mad_ms}
+
+
+def _recorder(samples: list[float]) -> BenchmarkRecorder:
+    recorder = BenchmarkRecorder()
+    recorder.results["input.fill[100]"] = BenchmarkResult("input.fill[100]", samples)
+    return recorder
+
+
+def test_measure_records_one_sample_per_round():
+    recorder = BenchmarkRecorder()
+    calls = []
+
+    result = recorder.measure("noop", lambda: calls.append(1), rounds=5, warmup=2)
+
+    assert len(calls) == 7
+    assert len(result.samples) == 5
+    assert recorder.results == {"noop": result}
+
+
+def test_result_statistics():
+    result = BenchmarkResult("op", [10.0, 11.0, 12.0, 13.0, 100.0])
+
+    assert result.median_ms == 12.0
+    assert result.mad_ms == 1.0
+
+
+@pytest.mark.parametrize(
+    "samples, baseline, is_regression",
+    [
+        ([10.0, 10.0, 10.0], _baseline(10.0), False),
+        ([12.0, 12.0, 12.0], _baseline(10.0), False),  # within the relative tolerance
+        ([14.0, 14.0, 14.0], _baseline(10.0), True),
+        ([14.0, 14.0, 14.0], _baseline(10.0, mad_ms=2.0), False),  # within the baseline noise
+        ([1.4, 1.4, 1.4], _baseline(0.5), False),  # within the absolute floor
+    ],
+)
+def test_compare_uses_noise_aware_thresholds(samples: list[float], baseline: dict, is_regression: bool):
+    comparisons = _recorder(samples).compare({"input.fill[100]": baseline})
+
+    assert [comparison.is_regression for comparison in comparisons] == [is_regression]
+
+
+def test_compare_ignores_benchmarks_missing_from_baseline():
+    assert _recorder([10.0]).compare({"dropdown.select_option_by_value[100]": _baseline(10.0)}) == []
+
+
+def test_report_round_trips_as_baseline(tmp_path):
+    recorder = _recorder([10.0, 11.0, 12.0])
+    recorder.write_report(tmp_path / "baseline.json")
+
+    baseline = load_baseline(tmp_path / "baseline.json")
+
+    assert baseline["input.fill[100]"]["median_ms"] == 11.0
+    assert not recorder.compare(baseline)[0].is_regression
+    assert load_baseline(tmp_path / "missing.json") is None
+
+
+def test_record_keeps_samples_timed_elsewhere():
+    recorder = BenchmarkRecorder()
+
+    result = recorder.record("import.registry", [1.0, 2.0, 3.0])
+
+    assert result.median_ms == 2.0
+    assert recorder.results == {"import.registry": result}
+
+
+def test_update_baseline_keeps_benchmarks_that_did_not_run(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    previous = BenchmarkRecorder()
+    previous.record("dropdown.select_option_by_value[100]", [5.0])
+    previous.update_baseline(baseline_path)
+
+    _recorder([10.0, 11.0, 12.0]).update_baseline(baseline_path)
+
+    baseline = load_baseline(baseline_path)
+    assert baseline["input.fill[100]"]["median_ms"] == 11.0
+    assert baseline["dropdown.select_option_by_value[100]"]["sessions"] == [[5.0]]
+
+
+def test_update_baseline_keeps_the_last_sessions(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    for samples in ([40.0], [10.0, 11.0], [20.0, 21.0], [12.0, 13.0]):
+        _recorder(samples).update_baseline(baseline_path)
+
+    entry = load_baseline(baseline_path)["input.fill[100]"]
+
+    assert entry["sessions"] == [[10.0, 11.0], [20.0, 21.0], [12.0, 13.0]]
+    assert entry["median_ms"] == 12.5
+    assert entry["session_spread_ms"] == 10.0
+
+
+def test_session_spread_widens_the_threshold():
+    baseline = {"median_ms": 10.0, "mad_ms": 0.0, "session_spread_ms": 3.0}
+
+    assert not _recorder([12.8]).compare({"input.fill[100]": baseline})[0].is_regression
+    assert _recorder([13.2]).compare({"input.fill[100]": baseline})[0].is_regression
+
+
+def test_session_spread_allowance_is_capped():
+    baseline = {"median_ms": 10.0, "mad_ms": 0.0, "session_spread_ms": 8.0}
+
+    comparison = _recorder([14.0]).compare({"input.fill[100]": baseline})[0]
+
+    assert comparison.threshold_ms == 3.75
+    assert comparison.is_regression
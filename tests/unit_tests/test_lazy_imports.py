@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from web_abstractions.components import basic_components
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PACKAGE = "web_abstractions.components.basic_components"
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """
+    Runs the code in a fresh interpreter.
+
+    :param code: The Python code to run.
+    :return: The names of the modules loaded once the code has run.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules, sep='\\n')"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_registry_import_is_lazy():
+    loaded = _loaded_modules(f"import {PACKAGE}")
+
+    assert PACKAGE in loaded
+    assert "playwright" not in loaded
+    assert not [module for module in loaded if module.startswith(f"{PACKAGE}.")]
+
+
+def test_component_access_imports_only_its_module():
+    loaded = _loaded_modules(f"from {PACKAGE} import InputComponent")
+
+    components = {module for module in loaded if module.startswith(f"{PACKAGE}.")}
+    assert components == {f"{PACKAGE}.base", f"{PACKAGE}.input"}
+
+
+@pytest.mark.parametrize("name", basic_components.__all__)
+def test_every_registered_component_resolves(name: str):
+    assert getattr(basic_components, name).__name__ == name
+
+
+def test_unknown_component_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        basic_components.MissingComponent
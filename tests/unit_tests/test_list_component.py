@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+from web_abstractions.components.basic_components.list import ListComponent
+
+
+def _list_component(batches: list[dict]) -> ListComponent:
+    page = MagicMock()
+    page.locator.return_value.evaluate.side_effect = batches
+    return ListComponent(page, "#list", ".row", key_attribute="data-key", max_idle_rounds=3)
+
+
+def _batch(keys: list[str], moved: bool = True, at_end: bool = False) -> dict:
+    return {"items": keys, "atEnd": at_end, "moved": moved}
+
+
+def test_batches_without_new_items_do_not_stop_scrolling():
+    # A tall header: several scrolls without any new item before the rows show up.
+    batches = [_batch(["a"]), _batch(["a"]), _batch(["a"]), _batch(["a"]), _batch(["a"]), _batch(["b", "c"])]
+    batches += [_batch([], moved=False, at_end=True)] * 3
+    component = _list_component(batches)
+
+    assert component.collect(keys_only=True) == ["a", "b", "c"]
+    assert component.page.wait_for_timeout.call_count == 2
+
+
+def test_idle_rounds_at_the_end_stop_the_harvest():
+    batches = [_batch(["a"], at_end=True), _batch(["a"], at_end=True), _batch(["b"], at_end=True)]
+    batches += [_batch(["b"], moved=False, at_end=True)] * 3
+    component = _list_component(batches)
+
+    assert component.collect(keys_only=True) == ["a", "b"]
+    assert component.locator.evaluate.call_count == 6
+
+
+def test_limit_and_predicate_stop_early():
+    component = _list_component([_batch(["a", "b", "c"])] * 2)
+
+    assert component.collect(limit=2, keys_only=True) == ["a", "b"]
+    assert component.collect(until=lambda key: key == "a", keys_only=True) == ["a"]
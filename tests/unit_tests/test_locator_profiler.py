@@ -0,0 +1,180 @@
+from unittest.mock import MagicMock
+
+import pytest
+from playwright.sync_api import Locator
+
+from utils.locator_profiler import LocatorProfiler, classify, describe_locator
+from web_abstractions.components.basic_components.base import BaseComponent
+
+
+def _locator(matches: int, suggestions: list[str] | None = None, selector: str = "#email") -> MagicMock:
+    locator = MagicMock(spec=Locator)
+    locator.__repr__ = lambda _: f"<Locator frame=<Frame name= url='about:blank'> selector={selector!r}>"
+    locator.count.return_value = matches
+    locator.evaluate.return_value = suggestions or []
+    locator.first.evaluate.return_value = suggestions or []
+    return locator
+
+
+@pytest.fixture
+def enabled_profiler(monkeypatch: pytest.MonkeyPatch) -> LocatorProfiler:
+    # A profiler of its own, so that a --profile-locators run keeps its state and statistics.
+    profiler = LocatorProfiler(enabled=True)
+    monkeypatch.setattr("web_abstractions.components.basic_components.base.locator_profiler", profiler)
+    return profiler
+
+
+@pytest.mark.parametrize(
+    "strategy, query, matches, expected",
+    [
+        ("css", "#email", 1, set()),
+        ("css", "input", 0, {"no-match"}),
+        ("css", ".row", 3, {"strict-mode-near-miss"}),
+        ("css", "div:has(> input)", 1, {"css-has"}),
+        ("css", "text=Login", 1, {"text-match"}),
+        ("css", "form > *", 1, {"universal-selector"}),
+        ("xpath", "//input[@id='email']", 1, set()),
+        ("xpath", "//*[@id='email']", 1, {"xpath-wildcard"}),
+        ("xpath", "//div//button[contains(text(), 'Go')]", 1, {"xpath-nested-descendant", "xpath-text-match"}),
+        ("role", "get_by_role('button', name='Go')", 1, {"accessibility-tree-query"}),
+        ("label", "get_by_label('Email')", 2, {"accessibility-tree-query", "strict-mode-near-miss"}),
+        ("test_id", "get_by_test_id('email')", 1, set()),
+    ],
+)
+def test_classify(strategy: str, query: str, matches: int, expected: set[str]):
+    assert classify(strategy, query, matches) == expected
+
+
+def test_disabled_profiler_does_not_resolve_locators():
+    profiler = LocatorProfiler()
+    locator = _locator(1)
+
+    profiler.profile(locator, "css", "#email")
+
+    locator.count.assert_not_called()
+    assert profiler.stats == {}
+
+
+def test_suggestions_are_only_looked_up_for_flagged_locators():
+    profiler = LocatorProfiler(enabled=True)
+    cheap = _locator(1)
+    expensive = _locator(1, ['[data-testid="email"]'])
+
+    profiler.profile(cheap, "css", "#email")
+    profiler.profile(expensive, "label", "get_by_label('Email')")
+
+    cheap.evaluate.assert_not_called()
+    assert profiler.stats[("label", "get_by_label('Email')")].suggestions == ['[data-testid="email"]']
+
+
+def test_selectors_of_a_near_miss_are_not_suggested_as_equivalents():
+    profiler = LocatorProfiler(enabled=True)
+
+    profiler.profile(_locator(3, ["#first-row"]), "css", ".row")
+
+    stats = profiler.stats[("css", ".row")]
+    assert stats.suggestions == []
+    assert stats.first_match_selectors == ["#first-row"]
+
+
+def test_profiling_errors_never_reach_the_test(caplog: pytest.LogCaptureFixture):
+    profiler = LocatorProfiler(enabled=True)
+    locator = _locator(1)
+    locator.count.side_effect = RuntimeError("Target page, context or browser has been closed")
+
+    profiler.profile(locator, "css", "#email")
+
+    assert profiler.stats == {}
+    assert "Could not profile locator" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "selector, strategy",
+    [
+        ("#email", "css"),
+        ("//input[@id='email']", "xpath"),
+        ('internal:role=button[name="Go"i]', "role"),
+        ('internal:label="Email"i', "label"),
+        ('internal:attr=[placeholder="Email"i]', "placeholder"),
+        ('internal:testid=[data-testid="email"s]', "test_id"),
+        ('internal:attr=[alt="Logo"i]', "alt_text"),
+        ('internal:attr=[title="Help"i]', "title"),
+        ("form >> internal:role=textbox", "role"),
+    ],
+)
+def test_describe_locator(selector: str, strategy: str):
+    assert describe_locator(_locator(1, selector=selector)) == (strategy, selector)
+
+
+def test_components_are_profiled_on_first_use(enabled_profiler: LocatorProfiler):
+    page = MagicMock()
+    page.locator.return_value = _locator(1)
+
+    component = BaseComponent(page, "#email")
+    assert enabled_profiler.stats == {}
+
+    component.locator.fill("jane@example.com")
+    component.locator.fill("john@example.com")
+    assert enabled_profiler.stats[("css", "#email")].calls == 1
+
+
+def test_get_by_components_are_profiled_under_a_readable_query(enabled_profiler: LocatorProfiler):
+    page = MagicMock()
+    page.get_by_label.return_value = _locator(1, selector='internal:label="Email"i')
+
+    BaseComponent.by_label(page, "Email").locator.focus()
+
+    assert list(enabled_profiler.stats) == [("label", "get_by_label('Email')")]
+
+
+def test_locators_without_a_readable_selector_are_skipped(
+        enabled_profiler: LocatorProfiler, caplog: pytest.LogCaptureFixture
+):
+    page = MagicMock()
+    page.locator.return_value = MagicMock()  # its repr has no selector
+
+    component = BaseComponent(page, "#email")
+    component.locator.fill("jane@example.com")
+
+    component.locator.fill.assert_called_once_with("jane@example.com")
+    assert enabled_profiler.stats == {}
+    assert "Could not profile locator" in caplog.text
+
+
+def test_report_is_ranked_by_total_time():
+    profiler = LocatorProfiler()
+    profiler.merge(
+        [
+            {
+                "strategy": "css", "query": "#email", "calls": 5, "total_ms": 4.0, "max_ms": 1.0,
+                "min_matches": 1, "max_matches": 1, "flags": [], "suggestions": [], "first_match_selectors": [],
+            },
+            {
+                "strategy": "role", "query": "get_by_role('button')", "calls": 1, "total_ms": 9.0, "max_ms": 9.0,
+                "min_matches": 2, "max_matches": 2, "flags": ["strict-mode-near-miss"], "suggestions": [],
+                "first_match_selectors": [],
+            },
+        ]
+    )
+
+    report = profiler.report()
+
+    assert report["total_ms"] == 13.0
+    assert [locator["query"] for locator in report["locators"]] == ["get_by_role('button')", "#email"]
+    assert report["locators"][1]["mean_ms"] == 0.8
+
+
+def test_merge_aggregates_worker_statistics():
+    worker = LocatorProfiler(enabled=True)
+    worker.profile(_locator(1), "css", ".row")
+    worker.profile(_locator(3, ["#first-row"]), "css", ".row")
+
+    controller = LocatorProfiler()
+    controller.merge(worker.report()["locators"])
+    controller.merge(worker.report()["locators"])
+
+    stats = controller.stats[("css", ".row")]
+    assert stats.calls == 4
+    assert (stats.min_matches, stats.max_matches) == (1, 3)
+    assert stats.flags == {"strict-mode-near-miss"}
+    assert stats.first_match_selectors == ["#first-row"]
@@ -0,0 +1,245 @@
+import json
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+# Number of recording sessions kept per benchmark in the baseline, so that the thresholds also cover
+# the noise between sessions (machine load, CPU frequency) and not only between rounds of one session.
+BASELINE_SESSIONS = 3
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing samples of one benchmarked operation, in milliseconds.
+    """
+
+    name: str
+    samples: list[float]
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mad_ms(self) -> float:
+        """
+        Median absolute deviation of the samples, a noise estimate robust to outliers.
+        """
+        median = self.median_ms
+        return statistics.median(abs(sample - median) for sample in self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the result for the JSON results and baseline files.
+
+        :return: The result as a JSON-serializable dict.
+        """
+        return {
+            "median_ms": round(self.median_ms, 3),
+            "mad_ms": round(self.mad_ms, 3),
+            "min_ms": round(min(self.samples), 3),
+            "max_ms": round(max(self.samples), 3),
+            "samples": [round(sample, 3) for sample in self.samples],
+        }
+
+
+@dataclass
+class Comparison:
+    """
+    Outcome of comparing a benchmark result against its baseline.
+    """
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    threshold_ms: float
+
+    @property
+    def change(self) -> float:
+        return (self.current_ms - self.baseline_ms) / self.baseline_ms if self.baseline_ms else 0.0
+
+    @property
+    def is_regression(self) -> bool:
+        return self.current_ms > self.baseline_ms + self.threshold_ms
+
+    @property
+    def is_improvement(self) -> bool:
+        return self.current_ms < self.baseline_ms - self.threshold_ms
+
+
+class BenchmarkRecorder:
+    """
+    Times operations and compares the results against a stored baseline.
+
+    A result only counts as a regression when its median exceeds the baseline median by more than
+    the largest of: a relative tolerance, a multiple of the measured noise (MAD of the baseline or
+    of the current samples), the spread between the medians of the baseline recording sessions
+    (capped, so that a noisy baseline cannot hide real regressions) and an absolute floor for
+    operations too fast to compare reliably.
+    """
+
+    def __init__(
+            self,
+            rel_tolerance: float = 0.25,
+            noise_factor: float = 3.0,
+            min_threshold_ms: float = 1.0,
+            max_spread_factor: float = 1.5,
+    ):
+        """
+        Initializes the BenchmarkRecorder.
+
+        :param rel_tolerance: Allowed slowdown relative to the baseline median (0.25 = 25%).
+        :param noise_factor: Allowed slowdown as a multiple of the median absolute deviation.
+        :param min_threshold_ms: Allowed slowdown in milliseconds, whatever the noise.
+        :param max_spread_factor: Cap of the session spread allowance, as a multiple of the relative
+            tolerance (1.5 with a 25% tolerance allows at most a 37.5% slowdown for the spread).
+        """
+        self.rel_tolerance = rel_tolerance
+        self.noise_factor = noise_factor
+        self.min_threshold_ms = min_threshold_ms
+        self.max_spread_factor = max_spread_factor
+        self.results: dict[str, BenchmarkResult] = {}
+
+    def measure(self, name: str, operation: Callable[[], Any], rounds: int = 20, warmup: int = 3) -> BenchmarkResult:
+        """
+        Runs the operation repeatedly and records how long each round takes.
+
+        :param name: The unique name of the benchmark (e.g., 'input.fill[1000]').
+        :param operation: The operation to time.
+        :param rounds: The number of timed rounds.
+        :param warmup: The number of untimed rounds run first.
+        :return: The recorded result.
+        """
+        for _ in range(warmup):
+            operation()
+
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            operation()
+            samples.append((time.perf_counter() - start) * 1000)
+        return self.record(name, samples)
+
+    def record(self, name: str, samples: list[float]) -> BenchmarkResult:
+        """
+        Records samples timed elsewhere, e.g. inside a subprocess.
+
+        :param name: The unique name of the benchmark (e.g., 'import.registry').
+        :param samples: The timing samples, in milliseconds.
+        :return: The recorded result.
+        """
+        result = BenchmarkResult(name, samples)
+        self.results[name] = result
+        return result
+
+    def merge(self, results: dict[str, dict[str, Any]]) -> None:
+        """
+        Merges serialized results, e.g. the ones reported by the xdist workers.
+
+        :param results: The results serialized with ``report``.
+        """
+        for name, data in results.items():
+            self.results[name] = BenchmarkResult(name, list(data["samples"]))
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """
+        Builds the results report, sorted by benchmark name.
+
+        :return: The results as a JSON-serializable dict.
+        """
+        return {name: self.results[name].to_dict() for name in sorted(self.results)}
+
+    def write_report(self, path: str | Path) -> None:
+        """
+        Writes the results as JSON, in the format expected for a baseline.
+
+        :param path: The path of the results file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2))
+
+    def update_baseline(self, path: str | Path) -> None:
+        """
+        Adds the recorded results to the baseline as a new session, dropping the oldest session of
+        a benchmark beyond ``BASELINE_SESSIONS``. The entries of the benchmarks that did not run in
+        this session are kept as they are.
+
+        :param path: The path of the baseline file.
+        """
+        baseline = load_baseline(path) or {}
+        for name, result in self.results.items():
+            sessions = baseline.get(name, {}).get("sessions", [])
+            sessions = sessions + [[round(sample, 3) for sample in result.samples]]
+            baseline[name] = _baseline_entry(sessions[-BASELINE_SESSIONS:])
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+
+    def compare(self, baseline: dict[str, dict[str, Any]]) -> list[Comparison]:
+        """
+        Compares the recorded results with the baseline ones of the same name.
+
+        :param baseline: The baseline results, as written by ``update_baseline`` or ``write_report``.
+        :return: The comparisons of the benchmarks present in both, sorted by relative change.
+        """
+        comparisons = []
+        for name, result in self.results.items():
+            if name not in baseline:
+                continue
+            baseline_ms = baseline[name]["median_ms"]
+            noise_ms = max(baseline[name]["mad_ms"], result.mad_ms)
+            spread_ms = min(
+                baseline[name].get("session_spread_ms", 0.0),
+                self.max_spread_factor * self.rel_tolerance * baseline_ms,
+            )
+            threshold_ms = max(
+                self.rel_tolerance * baseline_ms,
+                self.noise_factor * noise_ms,
+                spread_ms,
+                self.min_threshold_ms,
+            )
+            comparisons.append(Comparison(name, baseline_ms, result.median_ms, threshold_ms))
+        return sorted(comparisons, key=lambda comparison: comparison.change, reverse=True)
+
+    def reset(self) -> None:
+        """
+        Drops all recorded results.
+        """
+        self.results.clear()
+
+
+def _baseline_entry(sessions: list[list[float]]) -> dict[str, Any]:
+    """
+    Builds the baseline entry of a benchmark from the samples of its recording sessions.
+
+    :param sessions: The samples of each recording session, oldest first.
+    :return: The baseline entry, with the statistics of the pooled samples.
+    """
+    pooled = BenchmarkResult("", [sample for session in sessions for sample in session])
+    session_medians = [statistics.median(session) for session in sessions]
+    return {
+        "median_ms": round(pooled.median_ms, 3),
+        "mad_ms": round(pooled.mad_ms, 3),
+        "session_spread_ms": round(max(session_medians) - min(session_medians), 3),
+        "sessions": sessions,
+    }
+
+
+def load_baseline(path: str | Path) -> dict[str, dict[str, Any]] | None:
+    """
+    Loads a baseline written by ``BenchmarkRecorder.update_baseline`` (or ``write_report``).
+
+    :param path: The path of the baseline file.
+    :return: The baseline results, or None if the file does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+benchmark_recorder = BenchmarkRecorder()
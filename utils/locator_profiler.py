@@ -0,0 +1,318 @@
+import ast
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Selector engines behind Playwright's get_by_* methods, mapped to the BaseComponent strategy names.
+ENGINE_STRATEGIES = {
+    "internal:role=": "role",
+    "internal:label=": "label",
+    "internal:attr=[placeholder=": "placeholder",
+    "internal:testid=": "test_id",
+    "internal:attr=[alt=": "alt_text",
+    "internal:attr=[title=": "title",
+}
+
+# Strategies whose resolution walks the accessibility tree instead of running a native DOM query.
+ACCESSIBILITY_TREE_STRATEGIES = {"role", "label"}
+
+# Patterns that force a scan of (a large part of) the DOM, keyed by the flag they raise.
+EXPENSIVE_PATTERNS: dict[str, dict[str, re.Pattern]] = {
+    "xpath": {
+        "xpath-wildcard": re.compile(r"//\*"),
+        "xpath-text-match": re.compile(r"text\(\)|contains\(|normalize-space\("),
+        "xpath-nested-descendant": re.compile(r"//.*//"),
+    },
+    "css": {
+        "css-has": re.compile(r":has\("),
+        "text-match": re.compile(r"^text=|:has-text\(|:text(-is|-matches)?\(|>> text="),
+        "universal-selector": re.compile(r"(^|[\s>+~])\*"),
+    },
+}
+
+# Collects the cheap selectors that match only the given element in the live DOM, most specific
+# attribute first.
+_SUGGEST_SELECTORS_SCRIPT = """
+element => {
+    const tag = element.tagName.toLowerCase();
+    const candidates = [];
+    for (const attribute of ["data-testid", "data-test", "data-qa"]) {
+        const value = element.getAttribute(attribute);
+        if (value) candidates.push(`[${attribute}="${CSS.escape(value)}"]`);
+    }
+    if (element.id) candidates.push(`#${CSS.escape(element.id)}`);
+    for (const attribute of ["name", "aria-label", "placeholder", "title", "alt"]) {
+        const value = element.getAttribute(attribute);
+        if (value) candidates.push(`${tag}[${attribute}="${CSS.escape(value)}"]`);
+    }
+    return candidates.filter(selector => document.querySelectorAll(selector).length === 1);
+}
+"""
+
+
+@dataclass
+class LocatorStats:
+    """
+    Aggregated resolution statistics of one locator (strategy and query) over a test run.
+    """
+
+    strategy: str
+    query: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    min_matches: int | None = None
+    max_matches: int = 0
+    flags: set[str] = field(default_factory=set)
+    suggestions: list[str] = field(default_factory=list)
+    first_match_selectors: list[str] = field(default_factory=list)
+
+    def add(
+            self,
+            elapsed_ms: float,
+            matches: int,
+            flags: set[str],
+            suggestions: list[str],
+            first_match_selectors: list[str],
+    ) -> None:
+        """
+        Adds one resolution of the locator to the statistics.
+
+        :param elapsed_ms: The time it took to resolve the locator, in milliseconds.
+        :param matches: The number of elements the locator matched.
+        :param flags: The flags raised for this resolution.
+        :param suggestions: Cheaper equivalent selectors, matching the same single element.
+        :param first_match_selectors: Selectors matching only the first of several matched elements.
+        """
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.min_matches = matches if self.min_matches is None else min(self.min_matches, matches)
+        self.max_matches = max(self.max_matches, matches)
+        self.flags |= flags
+        _extend_unique(self.suggestions, suggestions)
+        _extend_unique(self.first_match_selectors, first_match_selectors)
+
+    def merge(self, other: "LocatorStats") -> None:
+        """
+        Merges the statistics of the same locator gathered elsewhere (e.g. on another xdist worker).
+
+        :param other: The statistics to merge into this one.
+        """
+        self.calls += other.calls
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        if other.min_matches is not None:
+            self.min_matches = (
+                other.min_matches if self.min_matches is None else min(self.min_matches, other.min_matches)
+            )
+        self.max_matches = max(self.max_matches, other.max_matches)
+        self.flags |= other.flags
+        _extend_unique(self.suggestions, other.suggestions)
+        _extend_unique(self.first_match_selectors, other.first_match_selectors)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializes the statistics for the JSON report.
+
+        :return: The statistics as a JSON-serializable dict.
+        """
+        return {
+            "strategy": self.strategy,
+            "query": self.query,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "min_matches": self.min_matches,
+            "max_matches": self.max_matches,
+            "flags": sorted(self.flags),
+            "suggestions": self.suggestions,
+            "first_match_selectors": self.first_match_selectors,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LocatorStats":
+        """
+        Restores statistics serialized with ``to_dict``.
+
+        :param data: The serialized statistics.
+        :return: The restored statistics.
+        """
+        return cls(
+            strategy=data["strategy"],
+            query=data["query"],
+            calls=data["calls"],
+            total_ms=data["total_ms"],
+            max_ms=data["max_ms"],
+            min_matches=data["min_matches"],
+            max_matches=data["max_matches"],
+            flags=set(data["flags"]),
+            suggestions=list(data["suggestions"]),
+            first_match_selectors=list(data["first_match_selectors"]),
+        )
+
+
+def _extend_unique(selectors: list[str], new_selectors: list[str]) -> None:
+    for selector in new_selectors:
+        if selector not in selectors:
+            selectors.append(selector)
+
+
+def describe_locator(locator: Any) -> tuple[str, str]:
+    """
+    Derives the strategy and the query of a Playwright Locator from its selector.
+
+    :param locator: The Playwright Locator.
+    :return: The strategy ('css', 'xpath', 'role', 'label', ...) and the selector of the locator.
+    :raises ValueError: If the selector cannot be read from the locator.
+    """
+    # The selector is only exposed through the repr: <Locator frame=<Frame ...> selector='...'>
+    description = repr(locator)
+    if "> selector=" not in description:
+        raise ValueError(f"No selector in {description}")
+    selector = ast.literal_eval(description.split("> selector=", 1)[1][:-1])
+    last_part = selector.rsplit(" >> ", 1)[-1]
+    for engine, strategy in ENGINE_STRATEGIES.items():
+        if last_part.startswith(engine):
+            return strategy, selector
+    if last_part.startswith(("//", "xpath=")):
+        return "xpath", selector
+    return "css", selector
+
+
+def classify(strategy: str, query: str, matches: int) -> set[str]:
+    """
+    Flags the strict-mode near-misses and the expensive patterns of a resolved locator.
+
+    :param strategy: The locator strategy ('css', 'xpath', 'role', 'label', ...).
+    :param query: The selector or the description of the get_by_* query.
+    :param matches: The number of elements the locator matched.
+    :return: The raised flags.
+    """
+    flags = set()
+    if matches == 0:
+        flags.add("no-match")
+    elif matches > 1:
+        # Works for count()/all(), but any action on this locator fails in strict mode.
+        flags.add("strict-mode-near-miss")
+
+    if strategy in ACCESSIBILITY_TREE_STRATEGIES:
+        flags.add("accessibility-tree-query")
+    for flag, pattern in EXPENSIVE_PATTERNS.get(strategy, {}).items():
+        if pattern.search(query):
+            flags.add(flag)
+    return flags
+
+
+class LocatorProfiler:
+    """
+    Records how long each locator takes to resolve and how many elements it matches.
+
+    Profiling is disabled by default; once enabled, every component resolves its locator with an
+    extra count() round trip right before its first use, which is meant for profiling runs only.
+    Errors raised while profiling are logged and never reach the test.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initializes the LocatorProfiler.
+
+        :param enabled: Whether locators are profiled.
+        """
+        self.enabled = enabled
+        self.stats: dict[tuple[str, str], LocatorStats] = {}
+
+    def profile(self, locator: Any, strategy: str | None = None, query: str | None = None) -> None:
+        """
+        Resolves the locator and records its cost, match count, flags and cheaper alternatives.
+
+        :param locator: The Playwright Locator to resolve.
+        :param strategy: The locator strategy ('css', 'xpath', 'role', 'label', ...). Derived from the
+            locator with ``describe_locator`` when not given.
+        :param query: The selector or the description of the get_by_* query.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            if strategy is None:
+                strategy, query = describe_locator(locator)
+            start = time.perf_counter()
+            matches = locator.count()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            flags = classify(strategy, query, matches)
+            suggestions, first_match_selectors = [], []
+            if matches == 1 and flags:
+                suggestions = locator.evaluate(_SUGGEST_SELECTORS_SCRIPT)
+            elif matches > 1:
+                # Unique to the first match only, so not equivalent to the locator itself.
+                first_match_selectors = locator.first.evaluate(_SUGGEST_SELECTORS_SCRIPT)
+        except Exception as error:
+            logger.warning("Could not profile locator %s %r: %s", strategy, query or locator, error)
+            return
+
+        key = (strategy, query)
+        if key not in self.stats:
+            self.stats[key] = LocatorStats(strategy, query)
+        self.stats[key].add(elapsed_ms, matches, flags, suggestions, first_match_selectors)
+
+    def merge(self, stats: list[dict[str, Any]]) -> None:
+        """
+        Merges serialized statistics, e.g. the ones reported by the xdist workers.
+
+        :param stats: The statistics serialized with ``LocatorStats.to_dict``.
+        """
+        for data in stats:
+            other = LocatorStats.from_dict(data)
+            key = (other.strategy, other.query)
+            if key in self.stats:
+                self.stats[key].merge(other)
+            else:
+                self.stats[key] = other
+
+    def ranked(self) -> list[LocatorStats]:
+        """
+        Returns the recorded locators ranked by the total time spent resolving them.
+
+        :return: The locator statistics, most expensive first.
+        """
+        return sorted(self.stats.values(), key=lambda stats: stats.total_ms, reverse=True)
+
+    def report(self) -> dict[str, Any]:
+        """
+        Builds the run report.
+
+        :return: The report as a JSON-serializable dict.
+        """
+        ranked = self.ranked()
+        return {
+            "total_ms": round(sum(stats.total_ms for stats in ranked), 3),
+            "locators": [stats.to_dict() for stats in ranked],
+        }
+
+    def write_report(self, path: str | Path) -> None:
+        """
+        Writes the run report as JSON.
+
+        :param path: The path of the report file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2))
+
+    def reset(self) -> None:
+        """
+        Drops all recorded statistics.
+        """
+        self.stats.clear()
+
+
+locator_profiler = LocatorProfiler()
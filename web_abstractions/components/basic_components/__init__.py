@@ -0,0 +1,69 @@
+"""
+Registry of the basic components.
+
+Components are exposed lazily through the module ``__getattr__``: importing this package
+does not import Playwright or any component module, only the module of the component that
+is actually accessed. This keeps the start-up of every pytest-xdist worker cheap.
+
+    from web_abstractions.components.basic_components import InputComponent
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from web_abstractions.components.basic_components.autocomplete import AutocompleteComponent
+    from web_abstractions.components.basic_components.base import BaseComponent
+    from web_abstractions.components.basic_components.button import ButtonComponent
+    from web_abstractions.components.basic_components.checkbox import CheckboxComponent
+    from web_abstractions.components.basic_components.clickable import ClickableComponent
+    from web_abstractions.components.basic_components.dropdown import DropdownComponent
+    from web_abstractions.components.basic_components.image import ImageComponent
+    from web_abstractions.components.basic_components.input import InputComponent
+    from web_abstractions.components.basic_components.label import LabelComponent
+    from web_abstractions.components.basic_components.link import LinkComponent
+    from web_abstractions.components.basic_components.list import ListComponent
+    from web_abstractions.components.basic_components.radiobutton import RadioButtonComponent
+    from web_abstractions.components.basic_components.toggle import ToggleComponent
+    from web_abstractions.components.basic_components.tost import ToastComponent
+
+# Maps each exported component to the name of the module defining it.
+COMPONENTS: dict[str, str] = {
+    "AutocompleteComponent": "autocomplete",
+    "BaseComponent": "base",
+    "ButtonComponent": "button",
+    "CheckboxComponent": "checkbox",
+    "ClickableComponent": "clickable",
+    "DropdownComponent": "dropdown",
+    "ImageComponent": "image",
+    "InputComponent": "input",
+    "LabelComponent": "label",
+    "LinkComponent": "link",
+    "ListComponent": "list",
+    "RadioButtonComponent": "radiobutton",
+    "ToggleComponent": "toggle",
+    "ToastComponent": "tost",
+}
+
+__all__ = list(COMPONENTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the module of the requested component on first access and caches the class.
+
+    :param name: The name of the component class.
+    :return: The component class.
+    :raises AttributeError: If no component with this name is registered.
+    """
+    module_name = COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    component = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = component
+    return component
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
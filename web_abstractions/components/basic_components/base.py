@@ -1,6 +1,8 @@
 from playwright.sync_api import Page, Locator
 from typing import Type, TypeVar, Optional
 
+from utils.locator_profiler import locator_profiler
+
 T = TypeVar("T", bound="BaseComponent")
 
 
@@ -30,6 +32,25 @@ class BaseComponent:
         else:
             raise ValueError("Selector must be either a string or a Playwright Locator object.")
 
+    @property
+    def locator(self) -> Locator:
+        """
+        The Playwright Locator of the component. When locator profiling is enabled, its resolution
+        is profiled right before its first use.
+        """
+        if self._profile_pending:
+            self._profile_pending = False
+            strategy, query = self._profiled_as or (None, None)
+            locator_profiler.profile(self._locator, strategy, query)
+        return self._locator
+
+    @locator.setter
+    def locator(self, locator: Locator) -> None:
+        self._locator = locator
+        self._profile_pending = locator_profiler.enabled
+        # Strategy and query to profile the locator under, derived from the locator itself when None.
+        self._profiled_as: tuple[str, str] | None = None
+
     @classmethod
     def by_role(cls: Type[T], page: Page, role: str, name: Optional[str] = None) -> T:
         """
@@ -41,7 +62,7 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_role(role, name=name)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "role", f"get_by_role({role!r}, name={name!r})")
 
     @classmethod
     def by_label(cls: Type[T], page: Page, label: str) -> T:
@@ -53,7 +74,7 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_label(label)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "label", f"get_by_label({label!r})")
 
     @classmethod
     def by_placeholder(cls: Type[T], page: Page, placeholder: str) -> T:
@@ -65,7 +86,7 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_placeholder(placeholder)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "placeholder", f"get_by_placeholder({placeholder!r})")
 
     @classmethod
     def by_test_id(cls: Type[T], page: Page, test_id: str) -> T:
@@ -77,7 +98,7 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_test_id(test_id)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "test_id", f"get_by_test_id({test_id!r})")
 
     @classmethod
     def by_alt_text(cls: Type[T], page: Page, alt_text: str) -> T:
@@ -89,7 +110,7 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_alt_text(alt_text)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "alt_text", f"get_by_alt_text({alt_text!r})")
 
     @classmethod
     def by_title(cls: Type[T], page: Page, title: str) -> T:
@@ -101,5 +122,20 @@ class BaseComponent:
         :return: A new instance of the derived component class.
         """
         locator = page.get_by_title(title)
-        return cls(page, locator)
+        return cls._located_by(page, locator, "title", f"get_by_title({title!r})")
+
+    @classmethod
+    def _located_by(cls: Type[T], page: Page, locator: Locator, strategy: str, query: str) -> T:
+        """
+        Creates an instance of a component from a get_by_* locator, profiled under a readable query
+        when locator profiling is enabled.
 
+        :param page: The Playwright Page object representing the browser tab.
+        :param locator: The Locator built by one of the get_by_* methods.
+        :param strategy: The name of the locator strategy (e.g., 'role', 'label').
+        :param query: A readable description of the get_by_* query.
+        :return: A new instance of the derived component class.
+        """
+        component = cls(page, locator)
+        component._profiled_as = (strategy, query)
+        return component
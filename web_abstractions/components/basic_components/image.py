@@ -1,5 +1,5 @@
 from playwright.sync_api import Page, Locator
-from components.basic_components.base_component import BaseComponent
+from web_abstractions.components.basic_components.base import BaseComponent
 
 class ImageComponent(BaseComponent):
     """Encapsulates interactions with an image element on a web page."""
@@ -0,0 +1,145 @@
+from typing import Any, Callable, Iterator
+
+from playwright.sync_api import Page, Locator
+from web_abstractions.components.basic_components.base import BaseComponent
+
+# Reads every rendered item in one round trip, then scrolls the container (or the
+# document, when the container itself does not scroll) and waits for the next frame
+# so that the virtualized list has rendered the following window before the next call.
+_HARVEST_BATCH_SCRIPT = """
+(root, { itemSelector, keyAttribute, keysOnly, scrollRatio }) => {
+    const scrollable = /^(auto|scroll|overlay)$/.test(getComputedStyle(root).overflowY)
+        && root.scrollHeight > root.clientHeight;
+    const scroller = scrollable ? root : (document.scrollingElement || document.documentElement);
+    const items = [];
+    for (const element of root.querySelectorAll(itemSelector)) {
+        const key = keyAttribute
+            ? element.getAttribute(keyAttribute)
+            : (element.textContent || "").trim();
+        if (key === null || key === "") continue;
+        items.push(keysOnly ? key : { key, text: (element.textContent || "").trim() });
+    }
+    const before = scroller.scrollTop;
+    scroller.scrollTop = before + Math.max(1, Math.floor(scroller.clientHeight * scrollRatio));
+    const atEnd = scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 1;
+    const moved = scroller.scrollTop !== before;
+    return new Promise(resolve =>
+        requestAnimationFrame(() => requestAnimationFrame(() => resolve({ items, atEnd, moved })))
+    );
+}
+"""
+
+
+class ListComponent(BaseComponent):
+    """
+    Handles virtualized and infinite-scroll lists whose items are rendered while scrolling.
+
+    Items are harvested in batches: each batch reads all currently rendered items and scrolls
+    the list in a single in-page call, instead of one locator call per item.
+    """
+
+    def __init__(
+            self,
+            page: Page,
+            locator: str | Locator,
+            item_selector: str,
+            key_attribute: str | None,
+            scroll_ratio: float = 0.9,
+            settle_time: int = 250,
+            max_idle_rounds: int = 3,
+    ):
+        """
+        Initializes the ListComponent.
+
+        Args:
+            page (Page): The Playwright Page object representing the browser tab.
+            locator (str | Locator): The locator for the list (or its scroll container).
+            item_selector (str): CSS selector of the item elements, relative to the list.
+            key_attribute (str | None): Attribute holding a unique key per item (e.g. 'data-key'), used to
+                de-duplicate the items seen in several batches. With None the items are keyed by their
+                trimmed text, so items with the same text (e.g. two products named alike) are only
+                yielded once and the others are dropped.
+            scroll_ratio (float): Fraction of the visible height scrolled per batch. Values below 1
+                keep an overlap so that no item is skipped between two batches.
+            settle_time (int): Delay in milliseconds to wait for more items once the end is reached.
+            max_idle_rounds (int): Number of consecutive batches at the end of the list (or unable to
+                scroll further) without new items before stopping.
+        """
+        super().__init__(page, locator)
+        self.item_selector = item_selector
+        self.key_attribute = key_attribute
+        self.scroll_ratio = scroll_ratio
+        self.settle_time = settle_time
+        self.max_idle_rounds = max_idle_rounds
+
+    def iter_items(
+            self,
+            limit: int | None = None,
+            until: Callable[[Any], bool] | None = None,
+            keys_only: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Yields the list items as they are rendered while scrolling, de-duplicated by key.
+
+        Only the keys of already seen items are kept in memory. With ``keys_only`` the page
+        returns the keys alone, which keeps both the transfer and the memory footprint bounded.
+
+        Args:
+            limit (int | None): Stops after this many unique items have been yielded.
+            until (Callable[[Any], bool] | None): Stops after the first item for which it returns True.
+            keys_only (bool): Yields the item keys (str) instead of ``{"key": ..., "text": ...}`` dicts.
+
+        Yields:
+            Any: The item key, or a dict with the item key and text.
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        seen: set[str] = set()
+        idle_rounds = 0
+        arguments = {
+            "itemSelector": self.item_selector,
+            "keyAttribute": self.key_attribute,
+            "keysOnly": keys_only,
+            "scrollRatio": self.scroll_ratio,
+        }
+
+        while True:
+            batch = self.locator.evaluate(_HARVEST_BATCH_SCRIPT, arguments)
+            new_items = 0
+            for item in batch["items"]:
+                key = item if keys_only else item["key"]
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_items += 1
+                yield item
+                if limit is not None and len(seen) >= limit:
+                    return
+                if until is not None and until(item):
+                    return
+
+            if new_items or (batch["moved"] and not batch["atEnd"]):
+                # Batches without new items are expected while scrolling past headers or tall items.
+                idle_rounds = 0
+                continue
+
+            idle_rounds += 1
+            if idle_rounds >= self.max_idle_rounds:
+                return
+            # Gives infinite-scroll lists the chance to append the next page.
+            self.page.wait_for_timeout(self.settle_time)
+
+    def collect(
+            self,
+            limit: int | None = None,
+            until: Callable[[Any], bool] | None = None,
+            keys_only: bool = False,
+    ) -> list[Any]:
+        """
+        Collects the list items into a list. See ``iter_items`` for the arguments.
+
+        Returns:
+            list[Any]: The harvested item keys or item dicts, in rendering order.
+        """
+        return list(self.iter_items(limit=limit, until=until, keys_only=keys_only))